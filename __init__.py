@@ -8,21 +8,24 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
 from .api import FuelFinderApi
 from .const import (
     CONF_CLIENT_ID,
     CONF_CLIENT_SECRET,
-    CONF_FUEL_TYPE,
-    CONF_FUEL_TYPES,
     CONF_LATITUDE,
     CONF_LONGITUDE,
     CONF_ORS_API_KEY,
     CONF_RADIUS,
-    DEFAULT_FUEL_TYPES,
     DOMAIN,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+    TOKEN_STORAGE_KEY,
+    TOKEN_STORAGE_VERSION,
+    configured_fuel_types,
 )
-from .coordinator import FuelPricesCoordinator
+from .coordinator import FuelPricesCoordinator, SnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,14 +40,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         session,
         entry.data[CONF_CLIENT_ID],
         entry.data[CONF_CLIENT_SECRET],
+        token_store=Store(hass, TOKEN_STORAGE_VERSION, TOKEN_STORAGE_KEY),
     )
 
-    # Support legacy single fuel_type config (v1) alongside new fuel_types list (v2)
-    fuel_types = entry.data.get(CONF_FUEL_TYPES)
-    if not fuel_types:
-        legacy = entry.data.get(CONF_FUEL_TYPE)
-        fuel_types = [legacy] if legacy else DEFAULT_FUEL_TYPES
-
     coordinator = FuelPricesCoordinator(
         hass,
         api,
@@ -52,10 +50,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         home_lat=entry.data[CONF_LATITUDE],
         home_lon=entry.data[CONF_LONGITUDE],
         radius=entry.data[CONF_RADIUS],
-        fuel_types=fuel_types,
+        fuel_types=configured_fuel_types(entry.data),
         ors_api_key=entry.data.get(CONF_ORS_API_KEY) or None,
+        store=SnapshotStore(hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY),
     )
 
+    # Restore cached data from the last run so the first refresh can be an
+    # incremental fetch rather than a full download
+    await coordinator.async_load_snapshot()
+
     # Use async_refresh instead of async_config_entry_first_refresh so the
     # integration still loads when the API is temporarily unavailable (e.g.
     # maintenance).  Sensors will show as unavailable until data arrives.
@@ -79,3 +82,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached data snapshot and token when the entry is deleted."""
+    await Store(hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY).async_remove()
+    await Store(hass, TOKEN_STORAGE_VERSION, TOKEN_STORAGE_KEY).async_remove()
@@ -3,20 +3,36 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+from functools import lru_cache
 import logging
 import math
+import random
 import time
 from typing import Any
 
 import aiohttp
+from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 
 from .const import (
     BATCH_SIZE,
     BRAND_DOMAINS,
+    ORS_MATRIX_MAX_DESTINATIONS,
     ORS_MATRIX_URL,
     PRICE_MAX,
     PRICE_MIN,
     PRICES_URL,
+    REQUEST_INTERVAL,
+    REQUEST_TIMEOUT,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_CAP,
+    RETRY_BUDGET_MIN_RETRIES,
+    RETRY_BUDGET_RATIO,
+    RETRY_BUDGET_WINDOW,
     STATIONS_URL,
     TOKEN_URL,
 )
@@ -32,6 +48,52 @@ class FuelFinderAuthError(FuelFinderApiError):
     """Raised when authentication fails."""
 
 
+class _RetryBudget:
+    """Sliding-window budget capping retries at a fraction of recent requests.
+
+    During an outage every request fails, so per-request retries multiply
+    the load on an API that is already struggling.  Retries are allowed only
+    while they stay below ``ratio`` of the first attempts seen in the window
+    (plus a small floor so isolated blips can always be retried).
+    """
+
+    def __init__(self, ratio: float, window: float, min_retries: int) -> None:
+        self._ratio = ratio
+        self._window = window
+        self._min_retries = min_retries
+        self._attempts: deque[tuple[float, bool]] = deque()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self._window
+        while self._attempts and self._attempts[0][0] < cutoff:
+            self._attempts.popleft()
+
+    def record(self, is_retry: bool) -> None:
+        """Record an attempt that is about to be sent."""
+        now = time.monotonic()
+        self._prune(now)
+        self._attempts.append((now, is_retry))
+
+    def can_retry(self) -> bool:
+        """Return True if another retry fits within the budget."""
+        self._prune(time.monotonic())
+        retries = sum(1 for _, is_retry in self._attempts if is_retry)
+        requests = len(self._attempts) - retries
+        return retries < self._min_retries + self._ratio * requests
+
+
+def _records_extractor(data: Any) -> Callable[[Any], list[dict[str, Any]]]:
+    """Return a function that pulls the record list out of a batch response.
+
+    Responses are either a bare list or wrapped as {"results": [...]} or
+    {"data": [...]}; the shape is detected once per pagination run.
+    """
+    if isinstance(data, list):
+        return lambda d: d
+    key = "results" if "results" in data else "data"
+    return lambda d: d.get(key, [])
+
+
 class FuelFinderApi:
     """Client for the GOV.UK Fuel Finder API."""
 
@@ -40,18 +102,86 @@ class FuelFinderApi:
         session: aiohttp.ClientSession,
         client_id: str,
         client_secret: str,
+        request_timeout: float = REQUEST_TIMEOUT,
+        token_store: Store[dict[str, Any]] | None = None,
     ) -> None:
         self._session = session
         self._client_id = client_id
         self._client_secret = client_secret
+        self._request_timeout = request_timeout
         self._access_token: str | None = None
+        self._auth_headers: dict[str, str] | None = None
         self._token_expiry: float = 0
+        self._token_store = token_store
+        self._token_store_loaded = False
+        self._token_lock = asyncio.Lock()
+        self._request_lock = asyncio.Lock()
+        self._next_request_at: float = 0
+        self._retry_budget = _RetryBudget(
+            RETRY_BUDGET_RATIO, RETRY_BUDGET_WINDOW, RETRY_BUDGET_MIN_RETRIES
+        )
+
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Hold the single API request slot, pacing request starts.
+
+        Waits only for whatever is left of REQUEST_INTERVAL since the previous
+        request started, so time spent on the wire counts towards the rate
+        limit instead of being added on top of a fixed sleep.
+        """
+        async with self._request_lock:
+            delay = self._next_request_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_request_at = time.monotonic() + REQUEST_INTERVAL
+            yield
+
+    async def _load_stored_token(self) -> bool:
+        """Reuse a still-valid token saved by a previous run.
+
+        Only checked once per client instance, so a token rejected by the
+        API (401) is never reloaded from storage.
+        """
+        if self._token_store is None or self._token_store_loaded:
+            return False
+        self._token_store_loaded = True
+
+        stored = await self._token_store.async_load()
+        if (
+            not stored
+            or stored.get("client_id") != self._client_id
+            or time.time() >= stored.get("token_expiry", 0) - 60
+        ):
+            return False
+
+        self._access_token = stored["access_token"]
+        self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
+        self._token_expiry = stored["token_expiry"]
+        _LOGGER.debug("Reusing stored access token")
+        return True
+
+    def _token_valid(self) -> bool:
+        """Return True if the current access token is still usable."""
+        return bool(self._access_token) and time.time() < self._token_expiry - 60
 
     async def _ensure_token(self) -> None:
-        """Obtain or refresh the OAuth access token."""
-        if self._access_token and time.time() < self._token_expiry - 60:
-            return
+        """Obtain or refresh the OAuth access token.
 
+        Station and price fetches run concurrently, so acquisition is
+        serialised: whoever waits on the lock reuses the token the first
+        caller loaded or requested instead of starting another exchange.
+        """
+        if self._token_valid():
+            return
+        async with self._token_lock:
+            if self._token_valid():
+                return
+            if await self._load_stored_token():
+                return
+            await self._request_token()
+
+    async def _request_token(self) -> None:
+        """Exchange the client credentials for a new access token."""
         data = {
             "grant_type": "client_credentials",
             "client_id": self._client_id,
@@ -60,7 +190,7 @@ class FuelFinderApi:
         }
 
         try:
-            async with self._session.post(
+            async with asyncio.timeout(self._request_timeout), self._session.post(
                 TOKEN_URL,
                 data=data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -70,15 +200,26 @@ class FuelFinderApi:
                     raise FuelFinderAuthError(
                         f"OAuth token request failed ({resp.status}): {text}"
                     )
-                result = await resp.json()
-        except aiohttp.ClientError as err:
+                result = await resp.json(loads=json_loads)
+        except (aiohttp.ClientError, TimeoutError) as err:
             raise FuelFinderApiError(f"Connection error during auth: {err}") from err
 
         # Response is wrapped: {"success": true, "data": {"access_token": ...}}
         token_data = result.get("data", result)
         self._access_token = token_data["access_token"]
+        self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
         self._token_expiry = time.time() + token_data.get("expires_in", 3600)
 
+        if self._token_store is not None:
+            # Only the short-lived token is stored, never the client secret
+            await self._token_store.async_save(
+                {
+                    "client_id": self._client_id,
+                    "access_token": self._access_token,
+                    "token_expiry": self._token_expiry,
+                }
+            )
+
     async def _get(
         self,
         url: str,
@@ -87,35 +228,55 @@ class FuelFinderApi:
     ) -> Any:
         """Make an authenticated GET request with retry logic.
 
-        Retries on transient errors (500, 502, 503, 504, timeouts) with
-        exponential backoff.  A 401 triggers a single token refresh.
+        Each attempt is bounded by the request timeout so a hung connection
+        fails fast.  Retries on transient errors (500, 502, 503, 504,
+        timeouts) with exponential backoff and decorrelated jitter, so
+        retries from many installations don't line up against the same
+        upstream.  A 401 drops the token so the next attempt refreshes it.
+        Once the retry budget is spent, the request fails immediately
+        instead of retrying.
         """
         retryable_statuses = {500, 502, 503, 504}
         last_error: Exception | None = None
+        delay = RETRY_BACKOFF_BASE
 
         for attempt in range(1, max_retries + 1):
+            if attempt > 1:
+                if not self._retry_budget.can_retry():
+                    _LOGGER.warning(
+                        "Retry budget exhausted, not retrying %s", url
+                    )
+                    raise FuelFinderApiError(
+                        f"Retry budget exhausted: {last_error}"
+                    ) from last_error
+                delay = random.uniform(
+                    RETRY_BACKOFF_BASE, min(RETRY_BACKOFF_CAP, delay * 3)
+                )
+                await asyncio.sleep(delay)
+
             await self._ensure_token()
-            headers = {"Authorization": f"Bearer {self._access_token}"}
+            headers = self._auth_headers
+            self._retry_budget.record(attempt > 1)
 
             try:
-                async with self._session.get(
-                    url, headers=headers, params=params
-                ) as resp:
+                async with (
+                    self._request_slot(),
+                    asyncio.timeout(self._request_timeout),
+                    self._session.get(url, headers=headers, params=params) as resp,
+                ):
                     if resp.status == 401:
-                        # Token may have expired, refresh and retry
+                        # Token may have expired; drop it so the next attempt
+                        # fetches a fresh one through the normal retry path
                         _LOGGER.debug("Got 401, refreshing token (attempt %d)", attempt)
                         self._access_token = None
-                        await self._ensure_token()
-                        headers["Authorization"] = f"Bearer {self._access_token}"
-                        async with self._session.get(
-                            url, headers=headers, params=params
-                        ) as retry_resp:
-                            if retry_resp.status != 200:
-                                text = await retry_resp.text()
-                                raise FuelFinderApiError(
-                                    f"API request failed after token refresh ({retry_resp.status}): {text}"
-                                )
-                            return await retry_resp.json()
+                        self._auth_headers = None
+                        text = await resp.text()
+                        last_error = FuelFinderApiError(
+                            f"API request unauthorised (attempt {attempt}/{max_retries}): {text}"
+                        )
+                        if attempt < max_retries:
+                            continue
+                        raise last_error
 
                     if resp.status in retryable_statuses:
                         text = await resp.text()
@@ -127,8 +288,6 @@ class FuelFinderApi:
                             resp.status, url, attempt, max_retries,
                         )
                         if attempt < max_retries:
-                            delay = 2 ** attempt  # 2s, 4s, 8s
-                            await asyncio.sleep(delay)
                             continue
                         raise last_error
 
@@ -137,7 +296,7 @@ class FuelFinderApi:
                         raise FuelFinderApiError(
                             f"API request failed ({resp.status}): {text}"
                         )
-                    return await resp.json()
+                    return await resp.json(loads=json_loads)
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as err:
                 last_error = FuelFinderApiError(
@@ -148,8 +307,6 @@ class FuelFinderApi:
                     url, attempt, max_retries, err,
                 )
                 if attempt < max_retries:
-                    delay = 2 ** attempt
-                    await asyncio.sleep(delay)
                     continue
                 raise FuelFinderApiError(
                     f"Connection failed after {max_retries} attempts: {err}"
@@ -168,8 +325,8 @@ class FuelFinderApi:
         longer delay) so the full dataset can be assembled.  This avoids
         permanent gaps in the cached data.
 
-        Includes a 2-second delay between batches to respect the API rate
-        limit of 30 req/min (1 concurrent request).
+        Requests go through ``_request_slot`` to respect the API rate limit
+        of 30 req/min (1 concurrent request).
 
         Args:
             since: Optional timestamp (YYYY-MM-DD HH:MM:SS) for incremental
@@ -180,21 +337,18 @@ class FuelFinderApi:
         failed_batches: list[int] = []
         consecutive_empty = 0
         consecutive_failures = 0
+        # Bound from the first response; every batch uses the same envelope
+        extract: Callable[[Any], list[dict[str, Any]]] | None = None
 
         while True:
-            if batch > 1:
-                await asyncio.sleep(2)
-
             try:
                 params: dict[str, Any] = {"batch-number": batch}
                 if since:
                     params["effective-start-timestamp"] = since
                 data = await self._get(url, params)
-                records = (
-                    data
-                    if isinstance(data, list)
-                    else data.get("results", data.get("data", []))
-                )
+                if extract is None:
+                    extract = _records_extractor(data)
+                records = extract(data)
 
                 if not records:
                     consecutive_empty += 1
@@ -237,12 +391,12 @@ class FuelFinderApi:
                 continue
 
         # --- Retry any failed batches once with a longer delay ---
+        still_failed: list[int] = []
         if failed_batches:
             _LOGGER.info(
                 "%s: retrying %d failed batches: %s",
                 label, len(failed_batches), failed_batches,
             )
-            still_failed: list[int] = []
             for retry_batch in failed_batches:
                 await asyncio.sleep(5)  # longer delay for retries
                 try:
@@ -250,11 +404,9 @@ class FuelFinderApi:
                     if since:
                         params["effective-start-timestamp"] = since
                     data = await self._get(url, params)
-                    records = (
-                        data
-                        if isinstance(data, list)
-                        else data.get("results", data.get("data", []))
-                    )
+                    if extract is None:
+                        extract = _records_extractor(data)
+                    records = extract(data)
                     if records:
                         all_records.extend(records)
                         _LOGGER.info(
@@ -287,7 +439,9 @@ class FuelFinderApi:
                 label, len(all_records), batch,
             )
 
-        if not all_records:
+        # Nothing having changed since the last fetch is a valid incremental
+        # result; only fail when batches actually went missing
+        if not all_records and (not since or still_failed):
             raise FuelFinderApiError(
                 f"Failed to fetch any {label.lower()} — all batches failed"
             )
@@ -337,6 +491,57 @@ def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float
     return r * 2 * math.asin(math.sqrt(a))
 
 
+def haversine_miles_bulk(
+    home_lat: float,
+    home_lon: float,
+    lats: Sequence[float],
+    lons: Sequence[float],
+) -> list[float]:
+    """Calculate distances in miles from one home point to many points.
+
+    Same formula as ``haversine_miles``, but the home point's trig is done
+    once per call rather than once per point, and the math functions are
+    bound to locals for the per-point loop.
+    """
+    sin, cos, asin, sqrt, radians = (
+        math.sin, math.cos, math.asin, math.sqrt, math.radians
+    )
+    diameter = 2 * 3958.8  # Earth diameter in miles
+    home_lat_r = radians(home_lat)
+    home_cos = cos(home_lat_r)
+    home_lon_r = radians(home_lon)
+
+    distances: list[float] = []
+    append = distances.append
+    for lat, lon in zip(lats, lons):
+        lat_r = radians(lat)
+        a = (
+            sin((lat_r - home_lat_r) / 2) ** 2
+            + home_cos * cos(lat_r) * sin((radians(lon) - home_lon_r) / 2) ** 2
+        )
+        append(diameter * asin(sqrt(a)))
+    return distances
+
+
+def bounding_box(
+    lat: float, lon: float, radius_miles: float
+) -> tuple[float, float, float, float]:
+    """Return (lat_min, lat_max, lon_min, lon_max) enclosing a radius.
+
+    Every point within ``radius_miles`` of (lat, lon) lies inside the box,
+    so it can cheaply reject points before running the Haversine formula.
+    """
+    angle = radius_miles / 3958.8  # angular radius in radians
+    lat_span = math.degrees(angle)
+    cos_lat = math.cos(math.radians(lat))
+    if cos_lat <= math.sin(angle):
+        # Circle reaches a pole; longitude is unconstrained
+        lon_span = 180.0
+    else:
+        lon_span = math.degrees(math.asin(math.sin(angle) / cos_lat))
+    return lat - lat_span, lat + lat_span, lon - lon_span, lon + lon_span
+
+
 def clean_price(raw_price: float | None) -> float | None:
     """Normalise a price value to pence per litre.
 
@@ -362,8 +567,12 @@ def clean_price(raw_price: float | None) -> float | None:
     return None
 
 
+@lru_cache(maxsize=256)
 def get_brand_icon(brand: str | None) -> str | None:
-    """Get a Clearbit logo URL for a brand."""
+    """Get a Clearbit logo URL for a brand.
+
+    Memoised: there are far fewer brands than stations.
+    """
     if not brand:
         return None
     brand_lower = brand.lower().strip()
@@ -373,30 +582,27 @@ def get_brand_icon(brand: str | None) -> str | None:
     return None
 
 
-async def get_driving_distances(
+async def _get_driving_distances_chunk(
     session: aiohttp.ClientSession,
     api_key: str,
     home_coords: tuple[float, float],
     station_coords: list[tuple[float, float]],
 ) -> list[float | None]:
-    """Get driving distances from home to stations using OpenRouteService Matrix API.
-
-    Returns distances in miles, or None for failed lookups.
-    """
-    if not station_coords:
-        return []
-
+    """Get driving distances for one ORS Matrix request worth of stations."""
     # ORS expects [longitude, latitude]
-    locations = [[home_coords[1], home_coords[0]]]
-    for lat, lon in station_coords:
-        locations.append([lon, lat])
-
-    body = {
-        "locations": locations,
-        "sources": [0],
-        "destinations": list(range(1, len(locations))),
-        "metrics": ["distance"],
-    }
+    locations = [(home_coords[1], home_coords[0])]
+    locations.extend((lon, lat) for lat, lon in station_coords)
+
+    # Serialised with Home Assistant's orjson-backed encoder rather than
+    # aiohttp's stdlib json.dumps
+    body = json_dumps(
+        {
+            "locations": locations,
+            "sources": [0],
+            "destinations": list(range(1, len(locations))),
+            "metrics": ["distance"],
+        }
+    )
 
     headers = {
         "Authorization": api_key,
@@ -404,14 +610,14 @@ async def get_driving_distances(
     }
 
     try:
-        async with session.post(
-            ORS_MATRIX_URL, json=body, headers=headers
+        async with asyncio.timeout(REQUEST_TIMEOUT), session.post(
+            ORS_MATRIX_URL, data=body, headers=headers
         ) as resp:
             if resp.status != 200:
                 _LOGGER.warning("ORS Matrix API returned %d", resp.status)
                 return [None] * len(station_coords)
-            data = await resp.json()
-    except aiohttp.ClientError as err:
+            data = await resp.json(loads=json_loads)
+    except (aiohttp.ClientError, TimeoutError) as err:
         _LOGGER.warning("ORS Matrix API error: %s", err)
         return [None] * len(station_coords)
 
@@ -423,3 +629,44 @@ async def get_driving_distances(
         else:
             results.append(round(d / 1609.344, 1))
     return results
+
+
+async def get_driving_distances(
+    session: aiohttp.ClientSession,
+    api_key: str,
+    home_coords: tuple[float, float],
+    station_coords: list[tuple[float, float]],
+) -> list[float | None]:
+    """Get driving distances from home to stations using OpenRouteService Matrix API.
+
+    Stations are split into chunks within the ORS matrix size limit and
+    the chunks are requested concurrently.  A failed chunk only loses the
+    distances for its own stations.
+
+    Returns distances in miles, or None for failed lookups.
+    """
+    if not station_coords:
+        return []
+
+    chunks = [
+        station_coords[i : i + ORS_MATRIX_MAX_DESTINATIONS]
+        for i in range(0, len(station_coords), ORS_MATRIX_MAX_DESTINATIONS)
+    ]
+    chunk_results = await asyncio.gather(
+        *(
+            _get_driving_distances_chunk(session, api_key, home_coords, chunk)
+            for chunk in chunks
+        ),
+        return_exceptions=True,
+    )
+
+    results: list[float | None] = []
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        if isinstance(chunk_result, BaseException):
+            _LOGGER.warning("ORS Matrix request failed: %s", chunk_result)
+            results.extend([None] * len(chunk))
+        else:
+            # Pad in case ORS returned fewer distances than requested
+            results.extend(chunk_result)
+            results.extend([None] * (len(chunk) - len(chunk_result)))
+    return results
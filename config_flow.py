@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 from typing import Any
 
-import aiohttp
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import SelectSelector, SelectSelectorConfig, SelectSelectorMode
 
 from .api import FuelFinderApi, FuelFinderAuthError, FuelFinderApiError
@@ -24,6 +25,7 @@ from .const import (
     DEFAULT_RADIUS,
     DOMAIN,
     FUEL_TYPES,
+    configured_fuel_types,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,12 +35,8 @@ async def _validate_credentials(
     hass: HomeAssistant, client_id: str, client_secret: str
 ) -> None:
     """Validate the API credentials by requesting a token."""
-    session = aiohttp.ClientSession()
-    try:
-        api = FuelFinderApi(session, client_id, client_secret)
-        await api.test_connection()
-    finally:
-        await session.close()
+    session = async_get_clientsession(hass)
+    await FuelFinderApi(session, client_id, client_secret).test_connection()
 
 
 # Build options list for the multi-select fuel type selector
@@ -46,6 +44,54 @@ _FUEL_TYPE_OPTIONS = [
     {"value": code, "label": label} for code, label in FUEL_TYPES.items()
 ]
 
+_FUEL_TYPE_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=_FUEL_TYPE_OPTIONS,
+        multiple=True,
+        mode=SelectSelectorMode.LIST,
+    )
+)
+
+
+# Only depends on the home location, so build each variant once
+@lru_cache(maxsize=4)
+def _user_schema(home_lat: float, home_lon: float) -> vol.Schema:
+    """Return the schema for the initial setup form."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_CLIENT_ID): str,
+            vol.Required(CONF_CLIENT_SECRET): str,
+            vol.Optional(CONF_LATITUDE, default=home_lat): vol.Coerce(float),
+            vol.Optional(CONF_LONGITUDE, default=home_lon): vol.Coerce(float),
+            vol.Optional(CONF_RADIUS, default=DEFAULT_RADIUS): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=100)
+            ),
+            vol.Optional(CONF_FUEL_TYPES, default=DEFAULT_FUEL_TYPES): _FUEL_TYPE_SELECTOR,
+            vol.Optional(CONF_ORS_API_KEY): str,
+        }
+    )
+
+
+def _options_schema(
+    latitude: float,
+    longitude: float,
+    radius: float,
+    fuel_types: list[str],
+    ors_api_key: str,
+) -> vol.Schema:
+    """Return the schema for the options form, defaulting to current values."""
+    return vol.Schema(
+        {
+            vol.Optional(CONF_LATITUDE, default=latitude): vol.Coerce(float),
+            vol.Optional(CONF_LONGITUDE, default=longitude): vol.Coerce(float),
+            vol.Optional(CONF_RADIUS, default=radius): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=100)
+            ),
+            vol.Optional(CONF_FUEL_TYPES, default=fuel_types): _FUEL_TYPE_SELECTOR,
+            vol.Optional(CONF_ORS_API_KEY, default=ors_api_key): str,
+        }
+    )
+
 
 class UkFuelPricesConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for UK Fuel Prices."""
@@ -65,6 +111,11 @@ class UkFuelPricesConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            # Only allow one instance of this integration; checked before
+            # validating so a duplicate doesn't cost a token request
+            await self.async_set_unique_id(DOMAIN)
+            self._abort_if_unique_id_configured()
+
             try:
                 await _validate_credentials(
                     self.hass,
@@ -82,10 +133,6 @@ class UkFuelPricesConfigFlow(ConfigFlow, domain=DOMAIN):
                 lat = user_input.get(CONF_LATITUDE) or self.hass.config.latitude
                 lon = user_input.get(CONF_LONGITUDE) or self.hass.config.longitude
 
-                # Only allow one instance of this integration
-                await self.async_set_unique_id(DOMAIN)
-                self._abort_if_unique_id_configured()
-
                 fuel_types = user_input.get(CONF_FUEL_TYPES, DEFAULT_FUEL_TYPES)
 
                 return self.async_create_entry(
@@ -101,30 +148,7 @@ class UkFuelPricesConfigFlow(ConfigFlow, domain=DOMAIN):
                     },
                 )
 
-        home_lat = self.hass.config.latitude
-        home_lon = self.hass.config.longitude
-
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_CLIENT_ID): str,
-                vol.Required(CONF_CLIENT_SECRET): str,
-                vol.Optional(CONF_LATITUDE, default=home_lat): vol.Coerce(float),
-                vol.Optional(CONF_LONGITUDE, default=home_lon): vol.Coerce(float),
-                vol.Optional(CONF_RADIUS, default=DEFAULT_RADIUS): vol.All(
-                    vol.Coerce(float), vol.Range(min=1, max=100)
-                ),
-                vol.Optional(
-                    CONF_FUEL_TYPES, default=DEFAULT_FUEL_TYPES
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=_FUEL_TYPE_OPTIONS,
-                        multiple=True,
-                        mode=SelectSelectorMode.LIST,
-                    )
-                ),
-                vol.Optional(CONF_ORS_API_KEY): str,
-            }
-        )
+        schema = _user_schema(self.hass.config.latitude, self.hass.config.longitude)
 
         return self.async_show_form(
             step_id="user",
@@ -155,41 +179,12 @@ class UkFuelPricesOptionsFlow(OptionsFlow):
         home_lat = self.hass.config.latitude
         home_lon = self.hass.config.longitude
 
-        # Support legacy single fuel_type config
-        current_fuel_types = current.get(CONF_FUEL_TYPES)
-        if not current_fuel_types:
-            legacy = current.get("fuel_type")
-            current_fuel_types = [legacy] if legacy else DEFAULT_FUEL_TYPES
-
-        schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_LATITUDE,
-                    default=current.get(CONF_LATITUDE, home_lat),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    CONF_LONGITUDE,
-                    default=current.get(CONF_LONGITUDE, home_lon),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    CONF_RADIUS,
-                    default=current.get(CONF_RADIUS, DEFAULT_RADIUS),
-                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=100)),
-                vol.Optional(
-                    CONF_FUEL_TYPES,
-                    default=current_fuel_types,
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=_FUEL_TYPE_OPTIONS,
-                        multiple=True,
-                        mode=SelectSelectorMode.LIST,
-                    )
-                ),
-                vol.Optional(
-                    CONF_ORS_API_KEY,
-                    default=current.get(CONF_ORS_API_KEY, ""),
-                ): str,
-            }
+        schema = _options_schema(
+            current.get(CONF_LATITUDE, home_lat),
+            current.get(CONF_LONGITUDE, home_lon),
+            current.get(CONF_RADIUS, DEFAULT_RADIUS),
+            configured_fuel_types(current),
+            current.get(CONF_ORS_API_KEY, ""),
         )
 
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from itertools import combinations
+from types import MappingProxyType
+from typing import Any
+
 DOMAIN = "uk_fuel_prices"
 
 CONF_CLIENT_ID = "api_token_id"
@@ -19,6 +25,19 @@ DEFAULT_RADIUS = 10
 DEFAULT_FUEL_TYPES = ["E10"]
 DEFAULT_SCAN_INTERVAL = 7200  # 2 hours
 
+# Cached API data persisted across restarts
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshot"
+SNAPSHOT_STORAGE_VERSION = 2
+SNAPSHOT_SAVE_DELAY = 30  # seconds
+# Snapshots whose last full fetch is older than this are discarded, so a
+# restart still heals gaps that incremental fetches cannot (e.g. stations
+# removed upstream)
+SNAPSHOT_MAX_AGE = 86400  # seconds
+
+# OAuth access token persisted so restarts can skip the token exchange
+TOKEN_STORAGE_KEY = f"{DOMAIN}.token"
+TOKEN_STORAGE_VERSION = 1
+
 # All supported fuel type codes and their full descriptions (for config UI)
 FUEL_TYPES = {
     "E10": "Regular Unleaded (E10)",
@@ -48,9 +67,29 @@ STATIONS_URL = "https://www.fuel-finder.service.gov.uk/api/v1/pfs"
 PRICES_URL = "https://www.fuel-finder.service.gov.uk/api/v1/pfs/fuel-prices"
 ORS_MATRIX_URL = "https://api.openrouteservice.org/v2/matrix/driving-car"
 
+# ORS free tier caps a matrix at 3500 routes (sources x destinations)
+ORS_MATRIX_MAX_DESTINATIONS = 3500
+
 BATCH_SIZE = 500
 
-BRAND_DOMAINS = {
+# API allows 30 requests/min with 1 concurrent request
+REQUEST_INTERVAL = 60 / 30
+REQUEST_TIMEOUT = 15  # seconds per request
+
+# Decorrelated-jitter backoff bounds for request retries (seconds)
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_CAP = 30.0
+
+# Retries may use at most this fraction of requests in the sliding window
+RETRY_BUDGET_RATIO = 0.1
+RETRY_BUDGET_WINDOW = 60  # seconds
+RETRY_BUDGET_MIN_RETRIES = 3
+
+# Shared read-only fallback for missing nested objects and data sections
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Keyed by lowercase brand name; read-only so lookups can be shared safely
+BRAND_DOMAINS: Mapping[str, str] = MappingProxyType({
     "tesco": "tesco.com",
     "sainsbury's": "sainsburys.co.uk",
     "sainsburys": "sainsburys.co.uk",
@@ -68,18 +107,25 @@ BRAND_DOMAINS = {
     "harvest": "harvestenergy.com",
     "applegreen": "applegreenstores.com",
     "costco": "costco.co.uk",
-}
+})
 
 
-def fuel_display_labels(selected_codes: list[str]) -> dict[str, str]:
-    """Build display labels for selected fuel types with smart disambiguation.
+def configured_fuel_types(data: Mapping[str, Any]) -> list[str]:
+    """Return the fuel types selected in a config entry's data.
 
-    Returns a mapping of fuel code -> display label, e.g.:
-      {"E10": "Petrol", "B7_STANDARD": "Diesel"}
-    or if two petrols are selected:
-      {"E10": "Petrol (E10)", "E5": "Petrol (E5)", "B7_STANDARD": "Diesel"}
+    Entries created before multi-fuel support (v1) only store a single
+    CONF_FUEL_TYPE; these are treated as a one-item selection.
     """
-    from collections import Counter
+    fuel_types = data.get(CONF_FUEL_TYPES)
+    if not fuel_types:
+        legacy = data.get(CONF_FUEL_TYPE)
+        fuel_types = [legacy] if legacy else DEFAULT_FUEL_TYPES
+    return fuel_types
+
+
+def _build_fuel_labels(selected_codes: Iterable[str]) -> dict[str, str]:
+    """Build display labels for a selection of fuel codes."""
+    selected_codes = list(selected_codes)
 
     # Count how many of each family are selected
     family_counts: Counter[str] = Counter()
@@ -96,3 +142,26 @@ def fuel_display_labels(selected_codes: list[str]) -> dict[str, str]:
             labels[code] = family
 
     return labels
+
+
+# Labels for every non-empty selection of known fuel codes, built at import
+_LABEL_CACHE: dict[frozenset[str], dict[str, str]] = {
+    frozenset(combo): _build_fuel_labels(combo)
+    for size in range(1, len(FUEL_FAMILY) + 1)
+    for combo in combinations(FUEL_FAMILY, size)
+}
+
+
+def fuel_display_labels(selected_codes: list[str]) -> dict[str, str]:
+    """Build display labels for selected fuel types with smart disambiguation.
+
+    Returns a mapping of fuel code -> display label, e.g.:
+      {"E10": "Petrol", "B7_STANDARD": "Diesel"}
+    or if two petrols are selected:
+      {"E10": "Petrol (E10)", "E5": "Petrol (E5)", "B7_STANDARD": "Diesel"}
+    """
+    labels = _LABEL_CACHE.get(frozenset(selected_codes))
+    if labels is None:
+        # Selection includes a code we don't know about
+        return _build_fuel_labels(selected_codes)
+    return dict(labels)
@@ -2,27 +2,146 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Collection, Sequence
 from datetime import datetime, timedelta, timezone
+import heapq
 import logging
+import sys
+import time
 from typing import Any
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
     FuelFinderApi,
     FuelFinderApiError,
+    bounding_box,
     clean_price,
     get_brand_icon,
     get_driving_distances,
-    haversine_miles,
+    haversine_miles_bulk,
+)
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    EMPTY_MAPPING,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_SAVE_DELAY,
+    fuel_display_labels,
 )
-from .const import DEFAULT_SCAN_INTERVAL, fuel_display_labels
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _clean_fuel_prices(
+    price_record: dict[str, Any],
+) -> dict[str, tuple[float | None, Any, str]]:
+    """Index a raw price record by fuel type, cleaning each price once.
+
+    Returns fuel code -> (cleaned price or None, raw price, last updated).
+    Fuel codes are interned so per-fuel lookups match by identity.
+    """
+    fuel_prices: dict[str, tuple[float | None, Any, str]] = {}
+    for fp in price_record.get("fuel_prices", []):
+        fuel_code = fp.get("fuel_type")
+        if fuel_code and fuel_code not in fuel_prices:
+            fuel_code = sys.intern(fuel_code)
+            raw_price = fp.get("price")
+            fuel_prices[fuel_code] = (
+                clean_price(raw_price),
+                raw_price,
+                fp.get("price_last_updated", ""),
+            )
+    return fuel_prices
+
+
+def _project_station(station: dict[str, Any]) -> dict[str, Any] | None:
+    """Reduce a raw station record to the fields the integration uses.
+
+    Returns None for closed stations and those without a usable location,
+    so they stay known to the cache without being considered for display.
+    """
+    sget = station.get
+    if sget("permanent_closure") or sget("temporary_closure"):
+        return None
+
+    lget = (sget("location") or EMPTY_MAPPING).get
+    try:
+        lat = float(lget("latitude", 0))
+        lon = float(lget("longitude", 0))
+    except (TypeError, ValueError):
+        return None
+    if not (lat and lon):
+        return None
+
+    brand = sget("brand_name", "")
+    return {
+        "node_id": sget("node_id", ""),
+        "station_name": sget("trading_name", "Unknown"),
+        # Only a few dozen brands, so share one string per brand
+        "brand": sys.intern(brand) if brand else "Unknown",
+        "brand_icon": get_brand_icon(brand),
+        "address": ", ".join(
+            filter(
+                None,
+                (
+                    lget("address_line_1", ""),
+                    lget("address_line_2", ""),
+                    lget("city", ""),
+                ),
+            )
+        ),
+        "postcode": lget("postcode", ""),
+        "latitude": lat,
+        "longitude": lon,
+    }
+
+
+def _build_attributes(data: dict[str, Any], fuel_label: str) -> dict[str, Any]:
+    """Build the sensor attribute dict from a station data entry."""
+    get = data.get
+    attrs: dict[str, Any] = {
+        "station_name": get("station_name"),
+        "brand": get("brand"),
+        "brand_icon": get("brand_icon"),
+        "address": get("address"),
+        "postcode": get("postcode"),
+        "distance_miles": get("distance_miles"),
+        "latitude": get("latitude"),
+        "longitude": get("longitude"),
+        "fuel_type": fuel_label,
+        "fuel_type_code": get("fuel_type"),
+        "last_update": get("last_update"),
+    }
+    driving_distance = get("driving_distance_miles")
+    if driving_distance is not None:
+        attrs["driving_distance_miles"] = driving_distance
+    return attrs
+
+
+class SnapshotStore(Store[dict[str, Any]]):
+    """Storage for the coordinator's cache snapshot.
+
+    The snapshot is only a cache, so one written in an older format is
+    discarded (forcing a full fetch) rather than migrated.
+    """
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Drop snapshots from older storage versions."""
+        _LOGGER.debug(
+            "Discarding snapshot from storage version %d", old_major_version
+        )
+        return {}
+
+
 class FuelPricesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to fetch and process fuel price data.
 
@@ -36,7 +155,7 @@ class FuelPricesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "by_fuel": {
                 "E10": {
                     "top3": [...],
-                    "stations": {...},
+                    "stations": {...},  # entries carry their sensor "attributes"
                 },
                 "B7_STANDARD": {
                     "top3": [...],
@@ -56,6 +175,7 @@ class FuelPricesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         radius: float,
         fuel_types: list[str],
         ors_api_key: str | None = None,
+        store: Store[dict[str, Any]] | None = None,
     ) -> None:
         super().__init__(
             hass,
@@ -68,13 +188,22 @@ class FuelPricesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._home_lat = home_lat
         self._home_lon = home_lon
         self._radius = radius
-        self._fuel_types = fuel_types
+        self._bbox = bounding_box(home_lat, home_lon, radius)
+        self._fuel_types = [sys.intern(code) for code in fuel_types]
         self._ors_api_key = ors_api_key
-
-        # Cached raw data keyed by node_id for incremental merging
-        self._cached_stations: dict[str, dict[str, Any]] = {}
-        self._cached_prices: dict[str, dict[str, Any]] = {}
+        self._store = store
+
+        # Cached data keyed by node_id for incremental merging.  Records are
+        # reduced to what the integration uses on the way in: stations to
+        # their display fields (None if closed or unlocated, see
+        # _project_station) and prices to cleaned values per fuel type.
+        self._cached_stations: dict[str, dict[str, Any] | None] = {}
+        self._cached_prices: dict[str, dict[str, tuple[float | None, Any, str]]] = {}
         self._last_fetch_time: str | None = None
+        self._last_full_fetch: float | None = None  # Unix timestamp
+
+        # Stations within the radius keyed by node_id, with their distance
+        self._stations_by_id: dict[str, dict[str, Any]] = {}
         self._normal_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
         self._retry_interval = timedelta(minutes=5)
 
@@ -82,6 +211,7 @@ class FuelPricesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Fetch data and process for all selected fuel types."""
         is_incremental = self._last_fetch_time is not None
 
+        fetched = True
         try:
             stations_raw, prices_raw = await self._fetch_data()
         except FuelFinderApiError as err:
@@ -91,8 +221,9 @@ class FuelPricesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     "(%d stations, %d prices)",
                     err, len(self._cached_stations), len(self._cached_prices),
                 )
-                stations_raw = list(self._cached_stations.values())
-                prices_raw = list(self._cached_prices.values())
+                # Nothing new to merge; the cache is used as-is below
+                stations_raw, prices_raw = [], []
+                fetched = False
             else:
                 self.update_interval = self._retry_interval
                 _LOGGER.warning(
@@ -100,51 +231,59 @@ class FuelPricesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     self._retry_interval, err,
                 )
                 raise UpdateFailed(f"Error fetching fuel data: {err}") from err
+        if stations_raw is None or prices_raw is None:
+            # Keep the side that failed inside the next incremental window
+            fetched = False
+            stations_raw = stations_raw or []
+            prices_raw = prices_raw or []
 
         # Merge into cache
+        stations_delta = {
+            nid: _project_station(station)
+            for station in stations_raw
+            if (nid := station.get("node_id"))
+        }
+        prices_delta = {
+            nid: _clean_fuel_prices(price)
+            for price in prices_raw
+            if (nid := price.get("node_id"))
+        }
         if is_incremental:
-            updated_stations = 0
-            for station in stations_raw:
-                nid = station.get("node_id", "")
-                if nid:
-                    self._cached_stations[nid] = station
-                    updated_stations += 1
-            updated_prices = 0
-            for price in prices_raw:
-                nid = price.get("node_id", "")
-                if nid:
-                    self._cached_prices[nid] = price
-                    updated_prices += 1
+            self._cached_stations.update(stations_delta)
+            self._cached_prices.update(prices_delta)
             _LOGGER.info(
                 "Incremental update: merged %d station updates, "
                 "%d price updates into cache (%d total stations, %d total prices)",
-                updated_stations, updated_prices,
+                len(stations_delta), len(prices_delta),
                 len(self._cached_stations), len(self._cached_prices),
             )
-            all_stations_raw = list(self._cached_stations.values())
-            all_prices_raw = list(self._cached_prices.values())
         else:
-            for station in stations_raw:
-                nid = station.get("node_id", "")
-                if nid:
-                    self._cached_stations[nid] = station
-            for price in prices_raw:
-                nid = price.get("node_id", "")
-                if nid:
-                    self._cached_prices[nid] = price
+            # A full fetch replaces the cache, dropping stations that have
+            # disappeared upstream
+            self._cached_stations = stations_delta
+            self._cached_prices = prices_delta
+            self._last_full_fetch = time.time()
             _LOGGER.info(
                 "Full fetch: cached %d stations, %d prices",
                 len(self._cached_stations), len(self._cached_prices),
             )
-            all_stations_raw = stations_raw
-            all_prices_raw = prices_raw
 
-        self._last_fetch_time = datetime.now(timezone.utc).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
+        # Only move the incremental window on after a successful fetch, so a
+        # failed one is covered by the next
+        if fetched:
+            self._last_fetch_time = datetime.now(timezone.utc).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+            if self._store is not None:
+                self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
 
-        # Build nearby station lookup (shared across all fuel types)
-        stations_by_id = self._build_station_lookup(all_stations_raw)
+        # Maintain the nearby station lookup (shared across all fuel types).
+        # Incremental fetches only re-check the stations they touched.
+        if not is_incremental:
+            self._rebuild_station_lookup()
+        elif stations_delta:
+            self._update_station_lookup(stations_delta.keys())
+        stations_by_id = self._stations_by_id
 
         # Build display labels for selected fuel types
         labels = fuel_display_labels(self._fuel_types)
@@ -153,24 +292,38 @@ class FuelPricesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         by_fuel: dict[str, dict[str, Any]] = {}
         for fuel_code in self._fuel_types:
             by_fuel[fuel_code] = self._process_fuel_type(
-                fuel_code, stations_by_id, all_prices_raw
+                fuel_code, stations_by_id, self._cached_prices
             )
 
-        # Optionally enrich top3 with driving distances (all fuel types)
+        # Optionally enrich top3 with driving distances (all fuel types).
+        # Fuel types often share top-3 stations, so each station is only
+        # requested once, in a single matrix request.
         if self._ors_api_key:
-            for fuel_code, fuel_data in by_fuel.items():
-                top3 = fuel_data.get("top3", [])
-                if top3:
-                    coords = [(s["latitude"], s["longitude"]) for s in top3]
-                    driving_dists = await get_driving_distances(
-                        self._session,
-                        self._ors_api_key,
-                        (self._home_lat, self._home_lon),
-                        coords,
-                    )
-                    for i, entry in enumerate(top3):
-                        if i < len(driving_dists) and driving_dists[i] is not None:
-                            entry["driving_distance_miles"] = driving_dists[i]
+            coords_by_id = {
+                entry["node_id"]: (entry["latitude"], entry["longitude"])
+                for fuel_data in by_fuel.values()
+                for entry in fuel_data["top3"]
+            }
+            if coords_by_id:
+                driving_dists = await get_driving_distances(
+                    self._session,
+                    self._ors_api_key,
+                    (self._home_lat, self._home_lon),
+                    list(coords_by_id.values()),
+                )
+                dist_by_id = dict(zip(coords_by_id, driving_dists))
+                for fuel_data in by_fuel.values():
+                    for entry in fuel_data["top3"]:
+                        driving_dist = dist_by_id.get(entry["node_id"])
+                        if driving_dist is not None:
+                            entry["driving_distance_miles"] = driving_dist
+
+        # Build each station's sensor attributes once per update.  A station's
+        # own sensor and any cheapest-rank sensor showing it share the dict.
+        for fuel_code, fuel_data in by_fuel.items():
+            fuel_label = labels[fuel_code]
+            for entry in fuel_data["stations"].values():
+                entry["attributes"] = _build_attributes(entry, fuel_label)
 
         # Restore normal polling interval after success
         if self.update_interval != self._normal_interval:
@@ -185,114 +338,188 @@ class FuelPricesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "by_fuel": by_fuel,
         }
 
-    def _build_station_lookup(
-        self, stations_raw: list[dict[str, Any]]
-    ) -> dict[str, dict[str, Any]]:
-        """Filter stations by radius and build lookup dict by node_id."""
-        stations_by_id: dict[str, dict[str, Any]] = {}
-        skipped_closed = 0
-        skipped_no_location = 0
-        skipped_out_of_range = 0
-
-        for station in stations_raw:
-            node_id = station.get("node_id", "")
-            if not node_id:
-                continue
+    async def async_load_snapshot(self) -> None:
+        """Restore the cache saved by a previous run, if any.
+
+        The first refresh then only fetches changes since the snapshot was
+        taken instead of downloading every batch again.
+        """
+        if self._store is None:
+            return
+        snapshot = await self._store.async_load()
+        if not snapshot or not snapshot.get("since"):
+            return
+        full_fetch_at = snapshot.get("full_fetch_at") or 0
+        if time.time() - full_fetch_at > SNAPSHOT_MAX_AGE:
+            _LOGGER.info(
+                "Discarding snapshot last fully fetched over %d hours ago",
+                SNAPSHOT_MAX_AGE // 3600,
+            )
+            return
+
+        self._cached_stations = snapshot.get("stations", {})
+        for station in self._cached_stations.values():
+            if station is not None:
+                station["brand"] = sys.intern(station["brand"])
+        # JSON storage turns the price tuples into lists
+        self._cached_prices = {
+            nid: {
+                sys.intern(code): tuple(info) for code, info in fuel_prices.items()
+            }
+            for nid, fuel_prices in snapshot.get("prices", {}).items()
+        }
+        self._last_fetch_time = snapshot["since"]
+        self._last_full_fetch = snapshot["full_fetch_at"]
+        self._rebuild_station_lookup()
+        _LOGGER.info(
+            "Restored snapshot from %s: %d stations, %d prices",
+            self._last_fetch_time,
+            len(self._cached_stations), len(self._cached_prices),
+        )
 
-            if station.get("permanent_closure") or station.get("temporary_closure"):
-                skipped_closed += 1
-                continue
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the cache in the form persisted to storage."""
+        return {
+            "since": self._last_fetch_time,
+            "full_fetch_at": self._last_full_fetch,
+            "stations": self._cached_stations,
+            "prices": self._cached_prices,
+        }
 
-            location = station.get("location", {})
-            try:
-                lat = float(location.get("latitude", 0))
-                lon = float(location.get("longitude", 0))
-            except (TypeError, ValueError):
-                skipped_no_location += 1
-                continue
-            if lat == 0 or lon == 0:
-                skipped_no_location += 1
-                continue
+    def _rebuild_station_lookup(self) -> None:
+        """Rebuild the nearby lookup from the whole station cache."""
+        ids: list[str] = []
+        lats: list[float] = []
+        lons: list[float] = []
+        for node_id, station in self._cached_stations.items():
+            if station is not None:
+                ids.append(node_id)
+                lats.append(station["latitude"])
+                lons.append(station["longitude"])
+
+        self._stations_by_id = self._build_station_lookup(ids, lats, lons)
+        _LOGGER.debug(
+            "Station filtering: %d in range, %d out of range, "
+            "%d closed or without location",
+            len(self._stations_by_id), len(ids) - len(self._stations_by_id),
+            len(self._cached_stations) - len(ids),
+        )
 
-            dist = haversine_miles(self._home_lat, self._home_lon, lat, lon)
-            if dist > self._radius:
-                skipped_out_of_range += 1
-                continue
+    def _update_station_lookup(self, node_ids: Collection[str]) -> None:
+        """Re-check only the given stations against the radius.
+
+        Used after an incremental fetch so the cost follows the number of
+        changed stations rather than the size of the cache.
+        """
+        ids: list[str] = []
+        lats: list[float] = []
+        lons: list[float] = []
+        for node_id in node_ids:
+            self._stations_by_id.pop(node_id, None)
+            station = self._cached_stations.get(node_id)
+            if station is not None:
+                ids.append(node_id)
+                lats.append(station["latitude"])
+                lons.append(station["longitude"])
+
+        self._stations_by_id.update(self._build_station_lookup(ids, lats, lons))
+        _LOGGER.debug(
+            "Station filtering: re-checked %d changed stations, %d in range",
+            len(node_ids), len(self._stations_by_id),
+        )
 
-            brand = station.get("brand_name", "")
-            address_parts = [
-                location.get("address_line_1", ""),
-                location.get("address_line_2", ""),
-                location.get("city", ""),
-            ]
-            address = ", ".join(p for p in address_parts if p)
-
-            stations_by_id[node_id] = {
-                "node_id": node_id,
-                "station_name": station.get("trading_name", "Unknown"),
-                "brand": brand or "Unknown",
-                "brand_icon": get_brand_icon(brand),
-                "address": address,
-                "postcode": location.get("postcode", ""),
-                "latitude": lat,
-                "longitude": lon,
-                "distance_miles": round(dist, 1),
-            }
+    def _build_station_lookup(
+        self,
+        node_ids: Sequence[str],
+        lats: Sequence[float],
+        lons: Sequence[float],
+    ) -> dict[str, dict[str, Any]]:
+        """Filter stations by radius and build lookup dict by node_id.
 
-        _LOGGER.debug(
-            "Station filtering: %d in range, %d closed, %d no location, %d out of range",
-            len(stations_by_id), skipped_closed, skipped_no_location, skipped_out_of_range,
+        A bounding-box check rejects most of the country before the exact
+        Haversine distance is computed for the remaining stations.
+        """
+        stations_by_id: dict[str, dict[str, Any]] = {}
+        lat_min, lat_max, lon_min, lon_max = self._bbox
+
+        near_ids: list[str] = []
+        near_lats: list[float] = []
+        near_lons: list[float] = []
+        for node_id, lat, lon in zip(node_ids, lats, lons):
+            if lat_min <= lat <= lat_max and lon_min <= lon <= lon_max:
+                near_ids.append(node_id)
+                near_lats.append(lat)
+                near_lons.append(lon)
+
+        distances = haversine_miles_bulk(
+            self._home_lat, self._home_lon, near_lats, near_lons
         )
+        for node_id, dist in zip(near_ids, distances):
+            if dist <= self._radius:
+                stations_by_id[node_id] = {
+                    **self._cached_stations[node_id],
+                    "distance_miles": round(dist, 1),
+                }
         return stations_by_id
 
     def _process_fuel_type(
         self,
         fuel_code: str,
         stations_by_id: dict[str, dict[str, Any]],
-        prices_raw: list[dict[str, Any]],
+        prices_by_id: dict[str, dict[str, tuple[float | None, Any, str]]],
     ) -> dict[str, Any]:
-        """Process prices for a single fuel type against nearby stations."""
-        candidates: list[dict[str, Any]] = []
-        matched = 0
+        """Process prices for a single fuel type against nearby stations.
+
+        Walks only the nearby stations and looks up each one's price record
+        by node_id, rather than scanning every price record in the cache.
+        """
+        # Ranking keys (price, distance, order seen, node_id) for top-3
+        # selection; the sensor-facing entries are only built once, below
+        candidates: list[tuple[float, float, int, str]] = []
+        matched_by_id: dict[str, dict[str, Any]] = {}
         no_fuel = 0
         bad_price = 0
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
-        for price_record in prices_raw:
-            node_id = price_record.get("node_id", "")
-            station = stations_by_id.get(node_id)
-            if not station:
+        for node_id, station in stations_by_id.items():
+            fuel_prices = prices_by_id.get(node_id)
+            if fuel_prices is None:
                 continue
 
-            found_fuel = False
-            for fp in price_record.get("fuel_prices", []):
-                if fp.get("fuel_type") == fuel_code:
-                    found_fuel = True
-                    raw_price = fp.get("price")
-                    cleaned = clean_price(raw_price)
-                    if cleaned is not None:
-                        entry = {**station}
-                        entry["price"] = cleaned
-                        entry["fuel_type"] = fuel_code
-                        entry["last_update"] = fp.get("price_last_updated", "")
-                        candidates.append(entry)
-                        matched += 1
-                    else:
-                        bad_price += 1
-                        _LOGGER.debug(
-                            "Station %s (%s) had invalid %s price: %s",
-                            station.get("station_name"), node_id,
-                            fuel_code, raw_price,
-                        )
-                    break
-            if not found_fuel and station:
+            price_info = fuel_prices.get(fuel_code)
+            if price_info is None:
                 no_fuel += 1
+                continue
 
-        candidates.sort(key=lambda x: (x["price"], x["distance_miles"]))
+            cleaned, raw_price, last_update = price_info
+            if cleaned is None:
+                bad_price += 1
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Station %s (%s) had invalid %s price: %s",
+                        station.get("station_name"), node_id,
+                        fuel_code, raw_price,
+                    )
+                continue
 
-        top3 = candidates[:3]
-        matched_by_id: dict[str, dict[str, Any]] = {}
-        for entry in candidates:
-            matched_by_id[entry["node_id"]] = entry
+            candidates.append(
+                (cleaned, station["distance_miles"], len(candidates), node_id)
+            )
+            # dict.copy() clones the station's hash table directly, which
+            # is cheaper than re-inserting every key via {**station}
+            entry = station.copy()
+            entry["price"] = cleaned
+            entry["fuel_type"] = fuel_code
+            entry["last_update"] = last_update
+            matched_by_id[node_id] = entry
+        matched = len(matched_by_id)
+
+        # Only the cheapest three are needed, so avoid sorting every candidate
+        top3 = [
+            matched_by_id[node_id]
+            for *_, node_id in heapq.nsmallest(3, candidates)
+        ]
 
         _LOGGER.info(
             "Results for %s: %d stations with valid prices, %d no %s price, "
@@ -307,13 +534,44 @@ class FuelPricesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _fetch_data(
         self,
-    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-        """Fetch stations and prices from the API sequentially."""
+    ) -> tuple[list[dict[str, Any]] | None, list[dict[str, Any]] | None]:
+        """Fetch stations and prices from the API concurrently.
+
+        The client's request slot still keeps to one request at a time, but
+        each fetch's backoff and retry delays overlap with the other's
+        requests instead of adding to the total.
+
+        If only one side of an incremental fetch fails, it is returned as
+        None so the side that succeeded can still be merged.
+        """
         since = self._last_fetch_time
         if since:
             _LOGGER.info("Performing incremental fetch since %s", since)
         else:
             _LOGGER.info("Performing full initial fetch")
-        stations = await self._api.fetch_all_stations(since=since)
-        prices = await self._api.fetch_all_prices(since=since)
-        return stations, prices
+        # Let both finish before raising so no fetch is left running
+        stations, prices = await asyncio.gather(
+            self._api.fetch_all_stations(since=since),
+            self._api.fetch_all_prices(since=since),
+            return_exceptions=True,
+        )
+        errors = [
+            result for result in (stations, prices)
+            if isinstance(result, BaseException)
+        ]
+        if not errors:
+            return stations, prices
+        # A full fetch needs both sides, and anything other than an API
+        # error is never swallowed
+        if not since or len(errors) > 1 or not isinstance(
+            errors[0], FuelFinderApiError
+        ):
+            raise errors[0]
+        _LOGGER.warning(
+            "Incremental fetch partly failed (%s), merging what was fetched",
+            errors[0],
+        )
+        return (
+            None if isinstance(stations, BaseException) else stations,
+            None if isinstance(prices, BaseException) else prices,
+        )
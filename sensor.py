@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -15,23 +14,13 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_FUEL_TYPES, DOMAIN, FUEL_TYPES
+from .const import DOMAIN, EMPTY_MAPPING, FUEL_TYPES, configured_fuel_types
 from .coordinator import FuelPricesCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-RANK_LABELS = {
-    0: "#1",
-    1: "#2",
-    2: "#3",
-}
-
-
-def _slugify(text: str) -> str:
-    """Create a slug from text for use in entity IDs."""
-    slug = text.lower().strip()
-    slug = re.sub(r"[^a-z0-9]+", "_", slug)
-    return slug.strip("_")
+# Indexed by rank (0 = cheapest)
+RANK_LABELS = ("#1", "#2", "#3")
 
 
 async def async_setup_entry(
@@ -42,11 +31,7 @@ async def async_setup_entry(
     """Set up the fuel price sensors."""
     coordinator: FuelPricesCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Get configured fuel types (with legacy fallback)
-    fuel_types = entry.data.get(CONF_FUEL_TYPES)
-    if not fuel_types:
-        legacy = entry.data.get("fuel_type")
-        fuel_types = [legacy] if legacy else ["E10"]
+    fuel_types = configured_fuel_types(entry.data)
 
     entities: list[SensorEntity] = []
 
@@ -57,19 +42,21 @@ async def async_setup_entry(
                 CheapestFuelSensor(coordinator, entry, fuel_code, rank)
             )
 
-    # Track which per-station sensors we've already created (keyed by fuel+node)
-    known_station_keys: set[str] = set()
+    # Track which per-station sensors we've already created, per fuel type
+    known_station_ids: dict[str, set[str]] = {
+        fuel_code: set() for fuel_code in fuel_types
+    }
 
     # Create per-station sensors for any stations already in data
-    if coordinator.data and coordinator.data.get("by_fuel"):
+    if coordinator.data and (by_fuel := coordinator.data.get("by_fuel")):
         for fuel_code in fuel_types:
-            fuel_data = coordinator.data["by_fuel"].get(fuel_code, {})
-            for node_id in fuel_data.get("stations", {}):
-                key = f"{fuel_code}_{node_id}"
-                entities.append(
-                    StationFuelSensor(coordinator, entry, fuel_code, node_id)
-                )
-                known_station_keys.add(key)
+            fuel_data = by_fuel.get(fuel_code, EMPTY_MAPPING)
+            station_ids = fuel_data.get("stations", EMPTY_MAPPING)
+            known_station_ids[fuel_code].update(station_ids)
+            entities.extend(
+                StationFuelSensor(coordinator, entry, fuel_code, node_id)
+                for node_id in station_ids
+            )
 
     async_add_entities(entities)
 
@@ -81,14 +68,18 @@ async def async_setup_entry(
             return
         new_entities: list[SensorEntity] = []
         for fuel_code in fuel_types:
-            fuel_data = coordinator.data["by_fuel"].get(fuel_code, {})
-            for node_id in fuel_data.get("stations", {}):
-                key = f"{fuel_code}_{node_id}"
-                if key not in known_station_keys:
-                    known_station_keys.add(key)
-                    new_entities.append(
-                        StationFuelSensor(coordinator, entry, fuel_code, node_id)
-                    )
+            fuel_data = coordinator.data["by_fuel"].get(fuel_code, EMPTY_MAPPING)
+            known = known_station_ids[fuel_code]
+            station_ids = fuel_data.get("stations", EMPTY_MAPPING).keys()
+            # Usually nothing is new; the subset test builds no new set
+            if station_ids <= known:
+                continue
+            new_ids = station_ids - known
+            known.update(new_ids)
+            new_entities.extend(
+                StationFuelSensor(coordinator, entry, fuel_code, node_id)
+                for node_id in new_ids
+            )
         if new_entities:
             _LOGGER.debug("Adding %d new station sensors", len(new_entities))
             async_add_entities(new_entities)
@@ -101,33 +92,13 @@ async def async_setup_entry(
 def _get_fuel_label(coordinator: FuelPricesCoordinator, fuel_code: str) -> str:
     """Get the display label for a fuel code from coordinator data."""
     if coordinator.data:
-        labels = coordinator.data.get("fuel_labels", {})
+        labels = coordinator.data.get("fuel_labels", EMPTY_MAPPING)
         if fuel_code in labels:
             return labels[fuel_code]
     # Fallback to full name
     return FUEL_TYPES.get(fuel_code, fuel_code)
 
 
-def _build_attributes(data: dict[str, Any], fuel_label: str) -> dict[str, Any]:
-    """Build the common attribute dict from a station data entry."""
-    attrs: dict[str, Any] = {
-        "station_name": data.get("station_name"),
-        "brand": data.get("brand"),
-        "brand_icon": data.get("brand_icon"),
-        "address": data.get("address"),
-        "postcode": data.get("postcode"),
-        "distance_miles": data.get("distance_miles"),
-        "latitude": data.get("latitude"),
-        "longitude": data.get("longitude"),
-        "fuel_type": fuel_label,
-        "fuel_type_code": data.get("fuel_type"),
-        "last_update": data.get("last_update"),
-    }
-    if "driving_distance_miles" in data:
-        attrs["driving_distance_miles"] = data["driving_distance_miles"]
-    return attrs
-
-
 class CheapestFuelSensor(CoordinatorEntity[FuelPricesCoordinator], SensorEntity):
     """Sensor showing a fuel station price, ranked by cheapest."""
 
@@ -147,15 +118,22 @@ class CheapestFuelSensor(CoordinatorEntity[FuelPricesCoordinator], SensorEntity)
         self._rank = rank
         self._rank_label = RANK_LABELS[rank]
         self._attr_unique_id = f"{entry.entry_id}_{fuel_code}_cheapest_{rank + 1}"
+        self._resolve_station_data()
 
-    @property
-    def _fuel_label(self) -> str:
-        """Get the smart display label for this sensor's fuel type."""
-        return _get_fuel_label(self.coordinator, self._fuel_code)
-
-    @property
-    def name(self) -> str:
-        """Return a dynamic name including fuel type, rank, and station."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Resolve this sensor's data once per coordinator update."""
+        self._resolve_station_data()
+        super()._handle_coordinator_update()
+
+    def _resolve_station_data(self) -> None:
+        """Look up the current station, fuel label and the name built from them."""
+        self._fuel_label = _get_fuel_label(self.coordinator, self._fuel_code)
+        self._station_data = self._find_station_data()
+        self._attr_name = self._build_name()
+
+    def _build_name(self) -> str:
+        """Build a dynamic name including fuel type, rank, and station."""
         label = self._fuel_label
         data = self._station_data
         if data:
@@ -167,13 +145,12 @@ class CheapestFuelSensor(CoordinatorEntity[FuelPricesCoordinator], SensorEntity)
             return f"{label} {self._rank_label} — {name} ({distance} mi)"
         return f"{label} {self._rank_label}"
 
-    @property
-    def _station_data(self) -> dict[str, Any] | None:
+    def _find_station_data(self) -> dict[str, Any] | None:
         """Return the data for this sensor's rank and fuel type."""
         if self.coordinator.data:
-            by_fuel = self.coordinator.data.get("by_fuel", {})
-            fuel_data = by_fuel.get(self._fuel_code, {})
-            top3 = fuel_data.get("top3", [])
+            by_fuel = self.coordinator.data.get("by_fuel", EMPTY_MAPPING)
+            fuel_data = by_fuel.get(self._fuel_code, EMPTY_MAPPING)
+            top3 = fuel_data.get("top3", ())
             if self._rank < len(top3):
                 return top3[self._rank]
         return None
@@ -183,7 +160,8 @@ class CheapestFuelSensor(CoordinatorEntity[FuelPricesCoordinator], SensorEntity)
         """Return the fuel price in pence per litre."""
         data = self._station_data
         if data:
-            return data.get("price")
+            # Every matched station entry carries a cleaned price
+            return data["price"]
         return None
 
     @property
@@ -192,7 +170,7 @@ class CheapestFuelSensor(CoordinatorEntity[FuelPricesCoordinator], SensorEntity)
         data = self._station_data
         if not data:
             return {}
-        return _build_attributes(data, self._fuel_label)
+        return data["attributes"]
 
     @property
     def available(self) -> bool:
@@ -221,6 +199,8 @@ class StationFuelSensor(CoordinatorEntity[FuelPricesCoordinator], SensorEntity):
             f"{entry.entry_id}_{fuel_code}_station_{node_id[:16]}"
         )
 
+        self._station_data = self._find_station_data()
+
         # Set a friendly name from the current data
         data = self._station_data
         fuel_label = _get_fuel_label(coordinator, fuel_code)
@@ -237,13 +217,18 @@ class StationFuelSensor(CoordinatorEntity[FuelPricesCoordinator], SensorEntity):
         else:
             self._attr_name = f"Fuel Station {node_id[:8]} — {fuel_label}"
 
-    @property
-    def _station_data(self) -> dict[str, Any] | None:
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Resolve this sensor's data once per coordinator update."""
+        self._station_data = self._find_station_data()
+        super()._handle_coordinator_update()
+
+    def _find_station_data(self) -> dict[str, Any] | None:
         """Return the data for this specific station and fuel type."""
         if self.coordinator.data:
-            by_fuel = self.coordinator.data.get("by_fuel", {})
-            fuel_data = by_fuel.get(self._fuel_code, {})
-            stations = fuel_data.get("stations", {})
+            by_fuel = self.coordinator.data.get("by_fuel", EMPTY_MAPPING)
+            fuel_data = by_fuel.get(self._fuel_code, EMPTY_MAPPING)
+            stations = fuel_data.get("stations", EMPTY_MAPPING)
             return stations.get(self._node_id)
         return None
 
@@ -252,7 +237,8 @@ class StationFuelSensor(CoordinatorEntity[FuelPricesCoordinator], SensorEntity):
         """Return the fuel price in pence per litre."""
         data = self._station_data
         if data:
-            return data.get("price")
+            # Every matched station entry carries a cleaned price
+            return data["price"]
         return None
 
     @property
@@ -261,8 +247,7 @@ class StationFuelSensor(CoordinatorEntity[FuelPricesCoordinator], SensorEntity):
         data = self._station_data
         if not data:
             return {}
-        fuel_label = _get_fuel_label(self.coordinator, self._fuel_code)
-        return _build_attributes(data, fuel_label)
+        return data["attributes"]
 
     @property
     def available(self) -> bool: